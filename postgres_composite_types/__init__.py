@@ -47,13 +47,20 @@ from django.db.backends.postgresql.base import \
 from django.db.backends.signals import connection_created
 from django.dispatch import Signal
 from psycopg2 import ProgrammingError
-from psycopg2.extensions import ISQLQuote, adapt, register_adapter
+from psycopg2.extensions import (
+    ISQLQuote, adapt, register_adapter, register_type)
 from psycopg2.extras import CompositeCaster, register_composite
 
 LOGGER = logging.getLogger(__name__)
 
 __all__ = ['CompositeType']
 
+# Casters returned by psycopg2's register_composite, keyed by
+# (db_type, connection alias). register_composite queries pg_type for the
+# type's metadata, so reuse its caster when registering the same type on
+# further connections instead of paying that round-trip again.
+_CASTER_CACHE = {}
+
 
 class QuotedCompositeType():
     """
@@ -108,6 +115,21 @@ class QuotedCompositeType():
         return self.value.getquoted() + b'::' + db_type
 
 
+# The form field class, resolved on first use. The .forms module imports
+# this module, so it can't be imported up top, but re-importing it on
+# every formfield() call pays the import lock and sys.modules lookup
+_COMPOSITE_TYPE_FIELD = None
+
+
+def _composite_type_field():
+    """Return the CompositeTypeField form field class, importing it once."""
+    global _COMPOSITE_TYPE_FIELD  # pylint:disable=global-statement
+    if _COMPOSITE_TYPE_FIELD is None:
+        from .forms import CompositeTypeField
+        _COMPOSITE_TYPE_FIELD = CompositeTypeField
+    return _COMPOSITE_TYPE_FIELD
+
+
 class BaseField(models.Field):
     """Base class for the field that relates to this type."""
 
@@ -118,8 +140,6 @@ class BaseField(models.Field):
     }
 
     def db_type(self, connection):
-        LOGGER.debug("db_type")
-
         if not isinstance(connection, PostgresDatabaseWrapper):
             raise RuntimeError("Composite types are only available "
                                "for postgres")
@@ -128,16 +148,50 @@ class BaseField(models.Field):
 
     def formfield(self, **kwargs):  # pylint:disable=arguments-differ
         """Form field for address."""
-        from .forms import CompositeTypeField
-
         defaults = {
-            'form_class': CompositeTypeField,
+            'form_class': _composite_type_field(),
             'model': self.Meta.model,
         }
         defaults.update(kwargs)
 
         return super().formfield(**defaults)
 
+    def get_prep_value(self, value):
+        """
+        Prepare a value for the database. Accepts instances of the
+        composite type as well as dicts of field values. Instances are
+        passed through untouched; the adapter registered with psycopg2
+        takes care of quoting them.
+        """
+        # Values are usually already instances of the composite type, so
+        # check for that first, with an exact type check rather than an
+        # isinstance MRO walk — this runs once per value prepared. The
+        # dict branch is the cold path and must accept dict subclasses
+        # such as OrderedDict.
+        model = self.Meta.model
+        if type(value) is model:  # pylint:disable=unidiomatic-typecheck
+            return value
+
+        if isinstance(value, dict):
+            return model(**value)
+
+        return value
+
+    def get_prep_value_many(self, values):
+        """
+        Prepare a list of composite values in a single pass.
+
+        Bulk operations otherwise dispatch to get_prep_value once per
+        row; for large batches doing the whole list in one comprehension
+        keeps the per-row work to the dict check.
+        """
+        if values is None:
+            return values
+
+        model = self.Meta.model
+        return [model(**value) if isinstance(value, dict) else value
+                for value in values]
+
     def to_python(self, value):
         """
         Convert a value to the correct type for this field. Values from the
@@ -187,20 +241,32 @@ class BaseOperation(migrations.operations.base.Operation):
     def describe(self):
         return 'Creates type %s' % self.Meta.db_type
 
+    def _create_type_sql(self, schema_editor):
+        """
+        Render the CREATE TYPE statement for this type.
+
+        The statement is cached per database alias on the Meta, as
+        field.db_type dispatches through the connection for every column
+        and the result can't change for a given database.
+        """
+        alias = schema_editor.connection.alias
+        try:
+            return self.Meta.create_sql_cache[alias]
+        except KeyError:
+            columns = ', '.join(
+                '%s %s' % (schema_editor.quote_name(name),
+                           field.db_type(schema_editor.connection))
+                for name, field in self.Meta.fields)
+
+            sql = 'CREATE TYPE %s AS (%s)' % (
+                schema_editor.quote_name(self.Meta.db_type), columns)
+            self.Meta.create_sql_cache[alias] = sql
+            return sql
+
     def database_forwards(self, app_label, schema_editor,
                           from_state, to_state):
 
-        fields = [
-            '%s %s' % (schema_editor.quote_name(name),
-                       field.db_type(schema_editor.connection))
-            for name, field in self.Meta.fields
-        ]
-
-        schema_editor.execute(' '.join((
-            "CREATE TYPE",
-            schema_editor.quote_name(self.Meta.db_type),
-            "AS (%s)" % ', '.join(fields),
-        )))
+        schema_editor.execute(self._create_type_sql(schema_editor))
 
         self.Meta.model.register_composite(schema_editor.connection)
 
@@ -212,6 +278,11 @@ class BaseOperation(migrations.operations.base.Operation):
         type_name = schema_editor.quote_name(self.Meta.db_type)
         schema_editor.execute('DROP TYPE %s' % type_name)
 
+        # The type will get a new oid if it is ever recreated, so the
+        # cached caster must not be reused
+        _CASTER_CACHE.pop(
+            (self.Meta.db_type, schema_editor.connection.alias), None)
+
 
 class BaseCaster(CompositeCaster):
     """
@@ -220,8 +291,12 @@ class BaseCaster(CompositeCaster):
     """
     Meta = None
 
+    # The model class, cached on the caster class so make() doesn't have
+    # to resolve the Meta.model attribute chain for every row
+    model = None
+
     def make(self, values):
-        return self.Meta.model(*values)
+        return self.model._from_db(values)
 
 
 def _add_class_to_module(cls, module_name):
@@ -230,6 +305,99 @@ def _add_class_to_module(cls, module_name):
     setattr(module, cls.__name__, cls)
 
 
+def _capture_descriptors(name, module, fields):
+    """Work around for not being able to call contribute_to_class.
+
+    Too much code to fake in our meta objects etc to be able to call
+    contribute_to_class directly, but we still want fields to be able
+    to set custom type descriptors. So we fake a model instead, with the
+    same fields as the composite type, and extract any custom descriptors
+    on that.
+
+    Returns a dict of {field_name: descriptor} for every field that
+    installed one.
+    """
+
+    attrs = {field_name: field for field_name, field in fields}
+
+    # we need to build a unique app label and model name combination for
+    # every composite type so django doesn't complain about model reloads
+    class Meta:
+        app_label = module
+    attrs['__module__'] = module
+    attrs['Meta'] = Meta
+    model_name = '_Fake{}Model'.format(name)
+
+    fake_model = type(model_name, (models.Model,), attrs)
+
+    descriptors = {}
+    for field_name, _ in fields:
+        # default None is for django 1.9
+        attr = getattr(fake_model, field_name, None)
+        if inspect.isdatadescriptor(attr):
+            descriptors[field_name] = attr
+    return descriptors
+
+
+def _specialize_serializers(name, fields):
+    """
+    Compile specialized __to_tuple__/__to_dict__ implementations for a
+    composite type with the given fields.
+
+    The generic implementations on CompositeType iterate Meta.fields and
+    look up each field's get_prep_value on every call. Serializing is done
+    once per row written, so instead compile the loop away once per class,
+    with each bound get_prep_value in the generated function's namespace.
+    """
+    namespace = {}
+    tuple_items = []
+    dict_items = []
+    for field_name, field in fields:
+        if type(field).get_prep_value is models.Field.get_prep_value:
+            # the field doesn't override the no-op get_prep_value, so
+            # don't bother calling it
+            value = 'self.%s' % field_name
+        else:
+            prep = '_prep_%s' % field_name
+            namespace[prep] = field.get_prep_value
+            value = '%s(self.%s)' % (prep, field_name)
+        tuple_items.append('%s, ' % value)
+        dict_items.append("'%s': %s, " % (field_name, value))
+
+    source = (
+        'def __to_tuple__(self):\n'
+        '    return (%s)\n'
+        'def __to_dict__(self):\n'
+        '    return {%s}\n'
+    ) % (''.join(tuple_items), ''.join(dict_items))
+
+    # pylint:disable=exec-used
+    exec(compile(source, '<%s serializers>' % name, 'exec'), namespace)
+    return namespace['__to_tuple__'], namespace['__to_dict__']
+
+
+def _specialize_from_db(name, fields):
+    """
+    Compile a specialized constructor for rows coming out of the database.
+
+    Decoding runs once per composite value fetched, so skip __init__'s
+    generic loop and assign every field with a single unpacking statement
+    compiled per class.
+    """
+    targets = ''.join('self.%s, ' % field_name for field_name, _ in fields)
+    source = (
+        'def _from_db(cls, values):\n'
+        '    self = cls.__new__(cls)\n'
+        '    (%s) = values\n'
+        '    return self\n'
+    ) % targets
+
+    namespace = {}
+    # pylint:disable=exec-used
+    exec(compile(source, '<%s from_db>' % name, 'exec'), namespace)
+    return classmethod(namespace['_from_db'])
+
+
 class CompositeTypeMeta(type):
     """Metaclass for Type."""
 
@@ -239,7 +407,9 @@ class CompositeTypeMeta(type):
         Guarantee the ordering of the declared attrs.
 
         We need this so that our type doesn't change ordering between
-        invocations.
+        invocations. Class bodies only collect into an ordered namespace
+        by default from Python 3.6, and this package still supports
+        older interpreters.
         """
         return OrderedDict()
 
@@ -271,6 +441,39 @@ class CompositeTypeMeta(type):
             raise TypeError("%s.Meta.db_type is required." % (name,))
 
         meta_obj.fields = fields
+        # the bound get_prep_value methods, paired with their field names,
+        # so per-value code doesn't resolve them through the field each time
+        meta_obj.prep_fields = tuple((field_name, field.get_prep_value)
+                                     for field_name, field in fields)
+        attrs['_field_names'] = tuple(field_name for field_name, _ in fields)
+        # CREATE TYPE statements rendered by the Operation, per database
+        # alias
+        meta_obj.create_sql_cache = {}
+        # default form fields, built lazily by forms.CompositeTypeField
+        # the first time this type is rendered in a form
+        meta_obj.formfield_defaults = None
+
+        # capture any custom descriptors installed by the fields, and store
+        # field values in slots to avoid a per-instance __dict__. Fields with
+        # custom descriptors keep using __dict__, as that is where descriptors
+        # conventionally keep their state.
+        descriptors = _capture_descriptors(name, attrs['__module__'], fields)
+        slots = tuple(field_name for field_name, _ in fields
+                      if field_name not in descriptors)
+        if descriptors:
+            slots += ('__dict__',)
+        attrs.setdefault('__slots__', slots)
+        attrs.update(descriptors)
+
+        # compile serializers specialized to this type's fields
+        to_tuple, to_dict = _specialize_serializers(name, fields)
+        attrs.setdefault('__to_tuple__', to_tuple)
+        attrs.setdefault('__to_dict__', to_dict)
+        if '__init__' not in attrs:
+            # The specialized constructor bypasses __init__, so a class
+            # that defines its own keeps the generic _from_db, which
+            # goes through cls(*values)
+            attrs.setdefault('_from_db', _specialize_from_db(name, fields))
 
         # create the field for this Type
         attrs['Field'] = type('%sField' % name,
@@ -295,6 +498,7 @@ class CompositeTypeMeta(type):
         new_cls._meta = meta_obj
 
         meta_obj.model = new_cls
+        new_cls.Caster.model = new_cls
 
         return new_cls
 
@@ -303,39 +507,10 @@ class CompositeTypeMeta(type):
         if name == 'CompositeType':
             return
 
-        cls._capture_descriptors()  # pylint:disable=no-value-for-parameter
-
         # Register the type on the first database connection
         connection_created.connect(receiver=cls.database_connected,
                                    dispatch_uid=cls._meta.db_type)
 
-    def _capture_descriptors(cls):
-        """Work around for not being able to call contribute_to_class.
-
-        Too much code to fake in our meta objects etc to be able to call
-        contribute_to_class directly, but we still want fields to be able
-        to set custom type descriptors. So we fake a model instead, with the
-        same fields as the composite type, and extract any custom descriptors
-        on that.
-        """
-
-        attrs = {field_name: field for field_name, field in cls._meta.fields}
-
-        # we need to build a unique app label and model name combination for
-        # every composite type so django doesn't complain about model reloads
-        class Meta:
-            app_label = cls.__module__
-        attrs['__module__'] = cls.__module__
-        attrs['Meta'] = Meta
-        model_name = '_Fake{}Model'.format(cls.__name__)
-
-        fake_model = type(model_name, (models.Model,), attrs)
-        for field_name, _ in cls._meta.fields:
-            # default None is for django 1.9
-            attr = getattr(fake_model, field_name, None)
-            if inspect.isdatadescriptor(attr):
-                setattr(cls, field_name, attr)
-
     def database_connected(cls, signal, sender, connection, **kwargs):
         """
         Register this type with the database the first time a connection is
@@ -370,7 +545,12 @@ class CompositeType(metaclass=CompositeTypeMeta):
     A new composite type stored in Postgres.
     """
 
+    # Subclasses get a __slots__ generated from their fields, so field
+    # values are stored in slots rather than a per-instance __dict__
+    __slots__ = ()
+
     _meta = None
+    _field_names = ()
 
     # The database connection this type is registered with
     registered_connection = None
@@ -379,34 +559,55 @@ class CompositeType(metaclass=CompositeTypeMeta):
         if args and kwargs:
             raise RuntimeError("Specify either args or kwargs but not both.")
 
-        # Initialise blank values for anyone expecting them
-        for name, _ in self._meta.fields:
-            setattr(self, name, None)
-
-        # Unpack any args as if they came from the type
-        for (name, _), arg in zip(self._meta.fields, args):
-            setattr(self, name, arg)
-
-        for name, value in kwargs.items():
-            setattr(self, name, value)
+        # A single pass over the fields, so no field is assigned twice.
+        # Fields not covered by args/kwargs are initialised to None for
+        # anyone expecting them.
+        field_names = self._field_names
+        if kwargs:
+            for name in field_names:
+                setattr(self, name, kwargs.get(name))
+            if len(kwargs) > len(field_names) or \
+                    not set(kwargs).issubset(field_names):
+                unexpected = sorted(set(kwargs).difference(field_names))
+                raise TypeError(
+                    "%s() got unexpected keyword arguments: %s" % (
+                        type(self).__name__, ', '.join(unexpected)))
+        elif args:
+            for name, value in zip(field_names, args):
+                setattr(self, name, value)
+            for name in field_names[len(args):]:
+                setattr(self, name, None)
+        else:
+            for name in field_names:
+                setattr(self, name, None)
 
     def __repr__(self):
+        # Use the raw field values. get_prep_value is for the database,
+        # and can be arbitrarily expensive; a repr shouldn't invoke it.
         return '<%s(%s)>' % (
             type(self).__name__,
-            ', '.join('%s=%s' % item for item in self.__to_dict__().items()),
+            ', '.join('%s=%r' % (name, getattr(self, name))
+                      for name in self._field_names),
         )
 
+    @classmethod
+    def _from_db(cls, values):
+        """
+        Build an instance from a row tuple returned by the database.
+        """
+        return cls(*values)
+
     def __to_tuple__(self):
         return tuple(
-            field.get_prep_value(getattr(self, name))
-            for name, field in self._meta.fields
+            get_prep_value(getattr(self, name))
+            for name, get_prep_value in self._meta.prep_fields
         )
 
     def __to_dict__(self):
-        return OrderedDict(
-            (name, field.get_prep_value(getattr(self, name)))
-            for name, field in self._meta.fields
-        )
+        return {
+            name: get_prep_value(getattr(self, name))
+            for name, get_prep_value in self._meta.prep_fields
+        }
 
     def __eq__(self, other):
         if not isinstance(other, CompositeType):
@@ -433,10 +634,24 @@ class CompositeType(metaclass=CompositeTypeMeta):
                      cls.__name__, connection)
         cls.registered_connection = connection
 
+        key = (cls._meta.db_type, connection.alias)
         with connection.temporary_connection() as cur:
             # This is what to do when the type is coming out of the database
-            register_composite(cls._meta.db_type, cur, globally=True,
-                               factory=cls.Caster)
+            caster = _CASTER_CACHE.get(key)
+            if caster is None:
+                caster = register_composite(cls._meta.db_type, cur,
+                                            globally=True,
+                                            factory=cls.Caster)
+                _CASTER_CACHE[key] = caster
+            else:
+                # The type's metadata was already fetched for this
+                # database, so reuse it rather than querying pg_type
+                # again. Registering against None is global, matching
+                # globally=True above; register_type doesn't accept
+                # Django's cursor wrapper
+                register_type(caster.typecaster, None)
+                if caster.array_typecaster is not None:
+                    register_type(caster.array_typecaster, None)
             # This is what to do when the type is going in to the database
             register_adapter(cls, QuotedCompositeType)
 
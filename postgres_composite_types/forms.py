@@ -91,10 +91,21 @@ class CompositeTypeField(forms.Field):
 
     def __init__(self, *args, fields=None, model=None, **kwargs):
         if fields is None:
-            fields = OrderedDict([
-                (name, field.formfield())
-                for name, field in model._meta.fields
-            ])
+            # Constructing the default form field for every model field is
+            # surprisingly expensive, so it is done once per composite
+            # type and cached on the Meta. Each CompositeTypeField gets
+            # deep copies of the cached fields — the widgets would
+            # otherwise be shared between every form built for this type,
+            # and mutating one would poison the cache.
+            defaults = model._meta.formfield_defaults
+            if defaults is None:
+                defaults = tuple(
+                    (name, field.formfield())
+                    for name, field in model._meta.fields
+                )
+                model._meta.formfield_defaults = defaults
+            fields = OrderedDict(
+                (name, copy.deepcopy(field)) for name, field in defaults)
         else:
             fields = OrderedDict(fields)
 
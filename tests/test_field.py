@@ -2,6 +2,7 @@
 
 import datetime
 import json
+from collections import OrderedDict
 from unittest import mock
 
 from django.core import serializers
@@ -126,6 +127,11 @@ class FieldTests(TestCase):
 
         self.assertEqual(result, "β ☃")
 
+    def test_unexpected_kwargs(self):
+        """Constructing a type with unknown field names raises TypeError"""
+        with self.assertRaises(TypeError):
+            SimpleType(a=1, bogus=2)
+
     def test_field_save_and_load_with_reserved_names(self):
         """Test save/load of a composite type with reserved field names"""
         start = datetime.datetime.now()
@@ -195,6 +201,78 @@ class FieldTests(TestCase):
         self.assertEqual(exception.code, 'bad_json')
 
 
+class TestPrepValue(TestCase):
+    """Tests for preparing composite values for the database."""
+
+    def test_get_prep_value_passthrough(self):
+        """Composite instances and None are passed through untouched."""
+        field = SimpleModel._meta.get_field('test_field')
+        value = SimpleType(a=1, b="b", c=datetime.datetime(1985, 10, 26, 9, 0))
+
+        self.assertIs(field.get_prep_value(value), value)
+        self.assertIsNone(field.get_prep_value(None))
+
+    def test_get_prep_value_dict(self):
+        """Dicts of field values are converted to composite instances."""
+        field = SimpleModel._meta.get_field('test_field')
+        when = datetime.datetime(1985, 10, 26, 9, 0)
+
+        prepped = field.get_prep_value({'a': 1, 'b': "b", 'c': when})
+
+        self.assertIsInstance(prepped, SimpleType)
+        self.assertEqual(prepped, SimpleType(a=1, b="b", c=when))
+
+    def test_get_prep_value_dict_subclass(self):
+        """dict subclasses such as OrderedDict are converted too."""
+        field = SimpleModel._meta.get_field('test_field')
+        when = datetime.datetime(1985, 10, 26, 9, 0)
+
+        prepped = field.get_prep_value(
+            OrderedDict([('a', 1), ('b', "b"), ('c', when)]))
+
+        self.assertIsInstance(prepped, SimpleType)
+        self.assertEqual(prepped, SimpleType(a=1, b="b", c=when))
+
+    def test_get_prep_value_many(self):
+        """A whole batch of values is prepared in a single pass."""
+        field = SimpleModel._meta.get_field('test_field')
+        when = datetime.datetime(1985, 10, 26, 9, 0)
+        value = SimpleType(a=1, b="b", c=when)
+
+        prepped = field.get_prep_value_many(
+            [value, {'a': 2, 'b': "x", 'c': when}, None])
+
+        self.assertIs(prepped[0], value)
+        self.assertEqual(prepped[1], SimpleType(a=2, b="x", c=when))
+        self.assertIsNone(prepped[2])
+
+    def test_get_prep_value_many_none(self):
+        """A null batch is passed through untouched."""
+        field = SimpleModel._meta.get_field('test_field')
+        self.assertIsNone(field.get_prep_value_many(None))
+
+
+class TestRegisterComposite(TestCase):
+    """Tests for explicitly registering composite types."""
+
+    def test_register_composite_twice(self):
+        """
+        Registering a type again on the same connection reuses the cached
+        caster without error.
+        """
+        # The connection_created signal will already have registered and
+        # cached the casters, so both of these calls hit the cache
+        SimpleType.register_composite(connection)
+        SimpleType.register_composite(connection)
+
+        # The type still round-trips
+        t = SimpleType(a=1, b="b", c=datetime.datetime(1985, 10, 26, 9, 0))
+        SimpleModel(test_field=t).save()
+
+        model = SimpleModel.objects.get()
+        self.assertEqual(model.test_field, t)
+
+
 class TestOptionalFields(TestCase):
     """
     Test optional composite type fields, and optional fields on composite types